@@ -1,40 +1,89 @@
-from flask import Flask, request, jsonify
-import logging
+from quart import Quart, Response, request
+import atexit
 import json
-from datetime import datetime
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from collections import deque
+import orjson
+
+app = Quart(__name__)
+
+def setup_logging():
+    # Console logging runs on a QueueListener thread; configured once per process
+    if any(h.get_name() == 'xrp_bot.queue' for h in logging.root.handlers):
+        return
+    # Set LOG_LEVEL=WARNING to silence per-signal logging in production
+    level_name = (os.environ.get('LOG_LEVEL') or '').upper()
+    level = logging.getLevelName(level_name) if level_name else logging.INFO
+    unknown_level = not isinstance(level, int)
+    if unknown_level:
+        level = logging.INFO
+    # Like basicConfig, leave a host's own root logging alone
+    if logging.root.handlers:
+        if level_name and not unknown_level:
+            logging.root.setLevel(level)
+    else:
+        log_queue = queue.Queue(-1)
+        log_handler = logging.StreamHandler()
+        log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        log_listener = logging.handlers.QueueListener(log_queue, log_handler, respect_handler_level=True)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.set_name('xrp_bot.queue')
+        logging.root.addHandler(queue_handler)
+        logging.root.setLevel(level)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+    if unknown_level:
+        logging.getLogger('xrp_bot').warning("Ignoring unknown LOG_LEVEL %r", level_name)
+
+setup_logging()
+logger = logging.getLogger('xrp_bot.webhook')
 
-app = Flask(__name__)
-logging.basicConfig(level=logging.INFO)
+# Accepted signal words and the trade side they map to
+_SIG_MAP = {'BUY': 'BUY', 'LONG': 'BUY', 'SELL': 'SELL', 'SHORT': 'SELL'}
 
-# Simple log list to store recent signals
-recent_signals = []
+def json_response(payload):
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+# Simple log of the last 10 signals
+recent_signals = deque(maxlen=10)
+
+# Last formatted timestamp, reused until the clock moves to the next second
+_last_ts = (None, '')
+
+def current_timestamp():
+    global _last_ts
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _last_ts[1]
 
 @app.route('/webhook', methods=['POST'])
-def webhook():
+async def webhook():
     try:
-        # Get raw data
-        raw_data = request.get_data()
+        # Get raw data; the body is read once and not kept on the request
+        raw_data = await request.get_data(cache=False)
         data = raw_data.decode('utf-8').strip()
        
-        # Parse signal
-        signal_type = None
-        if data.upper() in ['BUY', 'LONG']:
-            signal_type = 'BUY'
-        elif data.upper() in ['SELL', 'SHORT']:
-            signal_type = 'SELL'
-        else:
+        # Parse signal: JSON via orjson (stdlib fallback for NaN/Infinity), else plain-text word
+        action = data
+        if data[:1] == '{':
             try:
-                json_data = json.loads(data)
-                action = json_data.get('action', '').upper()
-                if action in ['BUY', 'LONG']:
-                    signal_type = 'BUY'
-                elif action in ['SELL', 'SHORT']:
-                    signal_type = 'SELL'
-            except:
-                pass
+                action = orjson.loads(raw_data).get('action')
+            except orjson.JSONDecodeError:
+                try:
+                    action = json.loads(raw_data).get('action')
+                except json.JSONDecodeError:
+                    action = None
+            if isinstance(action, str):
+                action = action.strip()
+        signal_type = _SIG_MAP.get(action.upper()) if isinstance(action, str) else None
        
         # Log signal
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = current_timestamp()
         signal_log = {
             'timestamp': timestamp,
             'signal': signal_type,
@@ -42,19 +91,17 @@ def webhook():
         }
        
         recent_signals.append(signal_log)
-        if len(recent_signals) > 10:  # Keep only last 10
-            recent_signals.pop(0)
        
-        print(f"[{timestamp}] Signal received: {signal_type} | Raw: {data}")
+        logger.info("[%s] Signal received: %s | Raw: %s", timestamp, signal_type, data)
        
         if signal_type:
-            return jsonify({
+            return json_response({
                 'success': True,
                 'message': f'Signal {signal_type} processed successfully',
                 'timestamp': timestamp
             })
         else:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'message': 'Invalid signal format',
                 'received': data
@@ -62,20 +109,21 @@ def webhook():
            
     except Exception as e:
         error_msg = f"Webhook error: {str(e)}"
-        print(f"ERROR: {error_msg}")
-        return jsonify({'success': False, 'message': error_msg})
+        logger.error(error_msg)
+        return json_response({'success': False, 'message': error_msg})
 
 @app.route('/')
-def home():
+async def home():
     return "TradingView Webhook Server is running!"
 
 @app.route('/status')
-def status():
-    return jsonify({
+async def status():
+    return json_response({
         'status': 'running',
-        'recent_signals': recent_signals,
+        'recent_signals': list(recent_signals),
         'total_signals': len(recent_signals)
     })
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000)
+    import uvicorn
+    uvicorn.run(app, host='0.0.0.0', port=5000, loop='uvloop', http='httptools', access_log=False)